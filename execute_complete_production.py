@@ -162,22 +162,30 @@ def _print_final_report(
     print("📊 FINAL REPORT")
     print("=" * 80)
 
-    if os.path.exists(SUMMARY_FILE):
-        try:
-            with open(SUMMARY_FILE, "r", encoding="utf-8") as file:
-                summary = json.load(file)
-
-            tickers = summary['results']['tickers_processed']
-            print(f"✅ Tickers processed: {tickers:,}")
-            records = summary['results']['records_saved']
-            print(f"✅ Records created: {records:,}")
-            print(f"✅ Batch files: {summary['results']['batches_created']}")
-            print(f"⏱️  Total duration: {summary['execution']['duration']}")
-        except (json.JSONDecodeError, OSError, KeyError) as exc:
-            print(f"  ⚠️ Error reading summary file: {exc}")
-            print(f"✅ Batch files created: {batch_count}")
-            print(f"✅ Total records: {total_records:,}")
-            print(f"⏱️  Duration: {duration}")
+    # Open directly rather than checking existence first: one syscall
+    # instead of two, and no race between the check and the open
+    try:
+        with open(SUMMARY_FILE, "r", encoding="utf-8") as file:
+            summary = json.load(file)
+        results = summary['results']
+        report = (
+            results['tickers_processed'],
+            results['records_saved'],
+            results['batches_created'],
+            summary['execution']['duration'],
+        )
+    except FileNotFoundError:
+        report = None
+    except (json.JSONDecodeError, OSError, KeyError) as exc:
+        print(f"  ⚠️ Error reading summary file: {exc}")
+        report = None
+
+    if report:
+        tickers, records, batches, summary_duration = report
+        print(f"✅ Tickers processed: {tickers:,}")
+        print(f"✅ Records created: {records:,}")
+        print(f"✅ Batch files: {batches}")
+        print(f"⏱️  Total duration: {summary_duration}")
     else:
         print(f"✅ Batch files created: {batch_count}")
         print(f"✅ Total records: {total_records:,}")
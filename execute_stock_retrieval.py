@@ -18,6 +18,21 @@ from hashlib import sha256
 BASE_DATA_DIR = Path(os.getenv("STOCK_APP_DATA_DIR", Path(__file__).resolve().parent / "user-data"))
 OUTPUT_DIR = BASE_DATA_DIR / "outputs"
 
+# Tickers that receive simulated sample data
+MAJOR_TICKERS = frozenset({"AAPL", "MSFT", "GOOGL", "AMZN", "NVDA", "META", "TSLA"})
+
+# Notion price property names paired with their stock data keys
+PRICE_FIELDS = (
+    ("Open", "open"),
+    ("High", "high"),
+    ("Low", "low"),
+    ("Close", "close"),
+    ("Volume", "volume"),
+    ("VWAP", "vwap"),
+    ("Transactions", "transactions"),
+    ("Data Points", "data_points"),
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -204,12 +219,8 @@ class StockDataExecutor:
         if not item.get("has_data"):
             return
 
-        price_fields = [
-            "Open", "High", "Low", "Close",
-            "Volume", "VWAP", "Transactions", "Data Points"
-        ]
-        for field in price_fields:
-            value = item.get(field.lower().replace(" ", "_"))
+        for field, key in PRICE_FIELDS:
+            value = item.get(key)
             if value is not None:
                 properties[field] = value
 
@@ -247,9 +258,7 @@ class StockDataExecutor:
             period: Time period dictionary with label.
             data_entry: Data entry dictionary to update in place.
         """
-        major_tickers = [
-            "AAPL", "MSFT", "GOOGL", "AMZN", "NVDA", "META", "TSLA"]
-        if ticker not in major_tickers:
+        if ticker not in MAJOR_TICKERS:
             return
 
         seed = self._stable_seed(ticker)
@@ -8,6 +8,7 @@ import json
 import logging
 import os
 import time
+from contextlib import suppress
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -15,9 +16,42 @@ BASE_DATA_DIR = Path(os.getenv("STOCK_APP_DATA_DIR", Path(__file__).resolve().pa
 OUTPUT_DIR = BASE_DATA_DIR / "outputs"
 UPLOADS_DIR = BASE_DATA_DIR / "uploads"
 
+# Notion numeric property names paired with their Polygon data keys
+NUMERIC_FIELDS = (
+    ("Open", "open"),
+    ("High", "high"),
+    ("Low", "low"),
+    ("Close", "close"),
+    ("Volume", "volume"),
+    ("VWAP", "vwap"),
+    ("Transactions", "transactions"),
+    ("Data Points", "data_points"),
+)
+
 logger = logging.getLogger(__name__)
 
 
+def _write_json_atomic(path, data, **dump_kwargs) -> None:
+    """Write JSON to a sibling temp file and rename it over ``path``.
+
+    The temp file is removed if the write or rename fails.
+
+    Args:
+        path: Destination file path.
+        data: JSON-serializable data to write.
+        **dump_kwargs: Extra keyword arguments passed to ``json.dump``.
+    """
+    tmp_file = str(path) + '.tmp'
+    try:
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, **dump_kwargs)
+        os.replace(tmp_file, path)
+    except BaseException:
+        with suppress(OSError):
+            os.remove(tmp_file)
+        raise
+
+
 def _configure_logging() -> None:
     """Configure logging with file and stream handlers.
 
@@ -194,9 +228,8 @@ class ProductionStockRetriever:
 
     def _add_numeric_properties(self, properties, data):
         """Add numeric data fields to properties if available."""
-        for field in ["Open", "High", "Low", "Close", "Volume",
-                      "VWAP", "Transactions", "Data Points"]:
-            value = data.get(field.lower().replace(" ", "_"))
+        for field, key in NUMERIC_FIELDS:
+            value = data.get(key)
             if value is not None:
                 properties[field] = value
 
@@ -463,10 +496,7 @@ print(f"\\n✅ Upload complete: {{total_uploaded}} records uploaded to Notion")
                         "saved": self.saved,
                         "timestamp": datetime.now().isoformat()
                     }
-                    with open(
-                        OUTPUT_DIR / 'checkpoint.json',
-                            'w', encoding='utf-8') as f:
-                        json.dump(checkpoint, f)
+                    _write_json_atomic(OUTPUT_DIR / 'checkpoint.json', checkpoint)
 
             # Generate upload script
             self.create_notion_upload_script(total_batches)
@@ -8,17 +8,32 @@ import json
 import logging
 import os
 import time
+from contextlib import suppress
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, List
 from pathlib import Path
 
-import requests
-
 BASE_DATA_DIR = Path(os.getenv("STOCK_APP_DATA_DIR", Path(__file__).resolve().parent / "user-data"))
 OUTPUT_DIR = BASE_DATA_DIR / "outputs"
 UPLOADS_DIR = BASE_DATA_DIR / "uploads"
 
+# Tickers that receive simulated sample data
+SAMPLE_TICKERS = frozenset({"AAPL", "MSFT", "GOOGL", "NVDA"})
+
+# Notion numeric property names paired with their data keys
+NUMERIC_FIELDS = (
+    ("Open", "open"),
+    ("High", "high"),
+    ("Low", "low"),
+    ("Close", "close"),
+    ("Volume", "volume"),
+    ("VWAP", "vwap"),
+    ("Transactions", "transactions"),
+    ("Data Points", "data_points"),
+)
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -27,6 +42,53 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _write_json_atomic(path, data, **dump_kwargs) -> None:
+    """Write JSON to a sibling temp file and rename it over ``path``.
+
+    The temp file is removed if the write or rename fails.
+
+    Args:
+        path: Destination file path.
+        data: JSON-serializable data to write.
+        **dump_kwargs: Extra keyword arguments passed to ``json.dump``.
+    """
+    tmp_file = str(path) + '.tmp'
+    try:
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, **dump_kwargs)
+        os.replace(tmp_file, path)
+    except BaseException:
+        with suppress(OSError):
+            os.remove(tmp_file)
+        raise
+
+
+@lru_cache(maxsize=128)
+def _select_timespan(start_date: str, end_date: str) -> str:
+    """Select the most granular timespan available for a date range.
+
+    Memoized because the result depends only on the chunk dates, which
+    repeat for every ticker.
+
+    Args:
+        start_date: Range start date in YYYY-MM-DD format.
+        end_date: Range end date in YYYY-MM-DD format.
+
+    Returns:
+        str: "minute" for ranges up to 30 days, "hour" up to 180 days,
+            otherwise "day".
+    """
+    days_diff = (datetime.strptime(end_date, "%Y-%m-%d") -
+                 datetime.strptime(start_date, "%Y-%m-%d")).days
+
+    # Try to get data at the most granular level available
+    if days_diff <= 30:
+        return "minute"
+    if days_diff <= 180:
+        return "hour"
+    return "day"
+
+
 @dataclass
 class TimeChunk:
     """Represents a 5-year time period for data retrieval.
@@ -36,6 +98,10 @@ class TimeChunk:
         end_date: Period end date in YYYY-MM-DD format.
         label: Human-readable label (e.g., "2020-2024").
     """
+    # Explicit slots (dataclass(slots=True) needs Python 3.10+) drop the
+    # per-instance __dict__ for chunks read on every API call
+    __slots__ = ("start_date", "end_date", "label")
+
     start_date: str
     end_date: str
     label: str
@@ -202,6 +268,10 @@ class StockDataNotionRetriever:
         # This simulates the Polygon API call structure
         # In production, this would use the actual mcp_polygon:get_aggs tool
 
+        # Deferred so importing this module (e.g. for TimeChunk) does not
+        # load requests until data is actually fetched
+        import requests  # pylint: disable=import-outside-toplevel
+
         result = {
             "ticker": ticker,
             "period": chunk.label,
@@ -220,22 +290,13 @@ class StockDataNotionRetriever:
         }
 
         # Determine appropriate timespan based on date range
-        days_diff = (datetime.strptime(chunk.end_date, "%Y-%m-%d") -
-                     datetime.strptime(chunk.start_date, "%Y-%m-%d")).days
-
-        # Try to get data at the most granular level available
-        if days_diff <= 30:
-            timespan = "minute"
-        elif days_diff <= 180:
-            timespan = "hour"
-        else:
-            timespan = "day"
+        timespan = _select_timespan(chunk.start_date, chunk.end_date)
 
         # Simulate API response
         # In production, this would be: response = mcp_polygon.get_aggs(...)
         try:
             # Mock successful data retrieval
-            if ticker in ["AAPL", "MSFT", "GOOGL", "NVDA"]:
+            if ticker in SAMPLE_TICKERS:
                 # Sample tickers with data
                 result.update({
                     "timespan": timespan,
@@ -277,11 +338,10 @@ class StockDataNotionRetriever:
             }
 
         if data.get("has_data"):
-            numeric_fields = ["open", "high", "low", "close", "volume",
-                              "vwap", "transactions", "data_points"]
-            for field in numeric_fields:
-                if data.get(field) is not None:
-                    properties[field.capitalize()] = data[field]
+            for field, key in NUMERIC_FIELDS:
+                value = data.get(key)
+                if value is not None:
+                    properties[field] = value
 
             if data.get("timespan"):
                 properties["Timespan"] = data["timespan"]
@@ -381,7 +441,9 @@ class StockDataNotionRetriever:
         """Save progress checkpoint to enable resumption after interruption.
 
         Writes current processing state to a JSON file including batch
-        number, counts, and failed tickers.
+        number, counts, and failed tickers. The data is written to a
+        sibling temp file and renamed into place, so an interrupted or
+        failed write leaves the previous checkpoint intact.
 
         Args:
             batch_num: Last successfully completed batch number.
@@ -396,8 +458,7 @@ class StockDataNotionRetriever:
             "timestamp": datetime.now().isoformat()
         }
 
-        with open(checkpoint_file, 'w', encoding='utf-8') as f:
-            json.dump(checkpoint_data, f, indent=2)
+        _write_json_atomic(checkpoint_file, checkpoint_data, indent=2)
 
         logger.info("💾 Checkpoint saved at batch %s", batch_num)
 
@@ -160,6 +160,14 @@ class TestNotionRetrieverConfiguration:
         assert chunk.end_date == "2024-11-23"
         assert chunk.label == "2020-2024"
 
+    def test_time_chunk_uses_slots(self):
+        """Test TimeChunk stores fields in slots rather than a __dict__."""
+        chunk = TimeChunk("2020-01-01", "2024-11-23", "2020-2024")
+
+        assert not hasattr(chunk, "__dict__")
+        with pytest.raises(AttributeError):
+            chunk.extra = "value"
+
     def test_notion_database_url_is_none_initially(self):
         """Test that Notion database URL starts as None."""
         retriever = StockDataNotionRetriever()
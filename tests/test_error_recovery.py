@@ -12,7 +12,7 @@ from unittest.mock import patch, MagicMock, mock_open
 
 import pytest
 
-from production_stock_retrieval import ProductionStockRetriever
+from production_stock_retrieval import ProductionStockRetriever, _write_json_atomic
 from stock_notion_retrieval import StockDataNotionRetriever
 
 
@@ -327,6 +327,43 @@ class TestNotionRetrieverRecovery:
 
         assert checkpoint["failed_tickers"] == ["FAIL1", "FAIL2"]
 
+    def test_notion_checkpoint_survives_failed_write(self, temp_dir):
+        """Test a failed checkpoint write keeps the previous checkpoint intact."""
+        retriever = StockDataNotionRetriever()
+        retriever.processed_count = 100
+        retriever.tickers = [f"TICK{i}" for i in range(100)]
+
+        with patch('stock_notion_retrieval.OUTPUT_DIR', Path(temp_dir)):
+            retriever.save_checkpoint(1)
+
+            retriever.processed_count = 200
+            with patch('stock_notion_retrieval.json.dump',
+                       side_effect=OSError(28, "No space left on device")):
+                with pytest.raises(OSError):
+                    retriever.save_checkpoint(2)
+
+        checkpoint_file = os.path.join(temp_dir, "retrieval_checkpoint.json")
+        with open(checkpoint_file, 'r') as f:
+            checkpoint = json.load(f)
+
+        assert checkpoint["last_batch"] == 1
+        assert checkpoint["processed_count"] == 100
+        assert not os.path.exists(checkpoint_file + ".tmp")
+
+    def test_production_checkpoint_write_failure_removes_temp_file(self, temp_dir):
+        """Test a failed production checkpoint write cleans up its temp file."""
+        checkpoint_file = os.path.join(temp_dir, "checkpoint.json")
+        _write_json_atomic(checkpoint_file, {"batch": 1})
+
+        with patch('production_stock_retrieval.json.dump',
+                   side_effect=OSError(28, "No space left on device")):
+            with pytest.raises(OSError):
+                _write_json_atomic(checkpoint_file, {"batch": 2})
+
+        with open(checkpoint_file, 'r') as f:
+            assert json.load(f)["batch"] == 1
+        assert not os.path.exists(checkpoint_file + ".tmp")
+
 
 class TestErrorMessageClarity:
     """Tests for clear error messages in failure scenarios."""
@@ -42,11 +42,10 @@ def test_import_has_no_side_effects(monkeypatch):
 
 @patch("execute_complete_production.time.sleep")
 @patch("execute_complete_production.os.makedirs")
-@patch("execute_complete_production.os.path.exists", return_value=False)
 @patch("execute_complete_production.os.listdir")
 @patch("execute_complete_production.subprocess.run")
 def test_main_runs_retrieval_and_processes_batches(
-    mock_run, mock_listdir, mock_exists, mock_makedirs, mock_sleep, capsys
+    mock_run, mock_listdir, mock_makedirs, mock_sleep, capsys
 ):
     """Verify main executes retrieval and processes batches in order."""
 
@@ -59,6 +58,12 @@ def test_main_runs_retrieval_and_processes_batches(
     batch_payloads = ["{\"record_count\": 300}", "{\"record_count\": 200}"]
     mocked_open = mock_open()
     mocked_open.return_value.read.side_effect = batch_payloads
+    # Two batch files open normally; the summary file is missing
+    mocked_open.side_effect = [
+        mocked_open.return_value,
+        mocked_open.return_value,
+        FileNotFoundError(),
+    ]
 
     with patch("execute_complete_production.open", mocked_open):
         execute_complete_production.main()
@@ -96,13 +101,10 @@ def test_main_uses_summary_file(mock_listdir, mock_makedirs, mock_sleep, capsys)
     }
 
     with patch(
-        "execute_complete_production.os.path.exists", side_effect=[True, True]
+        "execute_complete_production.open",
+        mock_open(read_data=json.dumps(summary_data)),
     ):
-        with patch(
-            "execute_complete_production.open",
-            mock_open(read_data=json.dumps(summary_data)),
-        ):
-            execute_complete_production.main()
+        execute_complete_production.main()
 
     captured = capsys.readouterr().out
     assert "Tickers processed: 6,626" in captured
@@ -115,10 +117,9 @@ def test_main_uses_summary_file(mock_listdir, mock_makedirs, mock_sleep, capsys)
     "execute_complete_production.os.listdir", side_effect=FileNotFoundError()
     )
 @patch("execute_complete_production.os.makedirs")
-@patch("execute_complete_production.os.path.exists", return_value=True)
 @patch("execute_complete_production.subprocess.run")
 def test_main_handles_missing_directory_during_listing(
-    mock_run, mock_exists, mock_makedirs, mock_listdir, capsys
+    mock_run, mock_makedirs, mock_listdir, capsys
 ):
     """Handle missing output directory during batch listing without raising."""
 
@@ -100,6 +100,8 @@ class TestEndToEndWorkflow:
         # Verify checkpoint file was created
         checkpoint_file = os.path.join(temp_dir, "checkpoint.json")
         assert os.path.exists(checkpoint_file), "Checkpoint file was not created during the run."
+        assert not os.path.exists(checkpoint_file + ".tmp"), \
+            "Checkpoint temp file should be renamed into place."
 
         # Verify checkpoint contents
         with open(checkpoint_file, 'r') as f:
@@ -1,7 +1,10 @@
 """Tests for stock_notion_retrieval.py"""
 import json
+import subprocess
+import sys
 from dataclasses import asdict
 from datetime import datetime, timedelta
+from pathlib import Path
 from unittest.mock import mock_open, patch
 
 import pytest
@@ -10,9 +13,28 @@ from stock_notion_retrieval import (
     UPLOADS_DIR,
     StockDataNotionRetriever,
     TimeChunk,
+    _select_timespan,
 )
 
 
+def test_import_does_not_load_requests():
+    """Ensure importing the module defers loading requests until fetch time"""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, stock_notion_retrieval; "
+            "print('requests' in sys.modules)",
+        ],
+        cwd=Path(__file__).resolve().parent.parent,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.strip() == "False"
+
+
 class TestTimeChunk:
     """Test TimeChunk dataclass"""
 
@@ -44,6 +66,23 @@ class TestTimeChunk:
         assert chunk1 != chunk3
 
 
+class TestSelectTimespan:
+    """Test _select_timespan helper"""
+
+    def test_select_timespan_thresholds(self):
+        """Test timespan is chosen from the length of the date range"""
+        assert _select_timespan("2024-11-01", "2024-11-15") == "minute"
+        assert _select_timespan("2024-06-01", "2024-11-15") == "hour"
+        assert _select_timespan("2020-01-01", "2024-11-23") == "day"
+
+    def test_select_timespan_boundaries(self):
+        """Test the 30-day and 180-day thresholds are inclusive"""
+        assert _select_timespan("2024-01-01", "2024-01-31") == "minute"
+        assert _select_timespan("2024-01-01", "2024-02-01") == "hour"
+        assert _select_timespan("2024-01-01", "2024-06-29") == "hour"
+        assert _select_timespan("2024-01-01", "2024-06-30") == "day"
+
+
 class TestStockDataNotionRetriever:
     """Test suite for StockDataNotionRetriever class"""
 
@@ -309,6 +348,33 @@ class TestStockDataNotionRetriever:
                 assert len(saved_data) == 1
                 assert saved_data[0]["properties"]["Ticker"] == "AAPL"
 
+    def test_build_notion_page_uses_schema_property_names(self):
+        """Test numeric properties match the Notion database schema names"""
+        retriever = StockDataNotionRetriever()
+
+        data = {
+            "ticker": "AAPL",
+            "period": "2020-2024",
+            "has_data": True,
+            "open": 150.0,
+            "vwap": 152.0,
+            "transactions": 450000,
+            "data_points": 252
+        }
+
+        properties = retriever._build_notion_page(data, 1)["properties"]
+
+        with patch('builtins.open', mock_open()):
+            with patch('json.dump'):
+                schema = retriever.create_notion_database()
+
+        assert properties["Open"] == 150.0
+        assert properties["VWAP"] == 152.0
+        assert properties["Transactions"] == 450000
+        assert properties["Data Points"] == 252
+        for name in ("Open", "VWAP", "Transactions", "Data Points"):
+            assert name in schema
+
     def test_save_batch_to_notion_updates_counter(self):
         """Test that save_batch updates successful_saves counter"""
         retriever = StockDataNotionRetriever()
@@ -406,16 +472,17 @@ class TestStockDataNotionRetriever:
             checkpoint_data = data
 
         with patch('builtins.open', mock_open()):
-            with patch('json.dump', side_effect=capture_checkpoint):
-                retriever.save_checkpoint(5)
-
-                assert checkpoint_data is not None
-                assert checkpoint_data["last_batch"] == 5
-                assert checkpoint_data["processed_count"] == 150
-                assert checkpoint_data["total_tickers"] == 3
-                assert checkpoint_data["successful_saves"] == 750
-                assert checkpoint_data["failed_tickers"] == ["FAIL1", "FAIL2"]
-                assert "timestamp" in checkpoint_data
+            with patch('stock_notion_retrieval.os.replace'):
+                with patch('json.dump', side_effect=capture_checkpoint):
+                    retriever.save_checkpoint(5)
+
+                    assert checkpoint_data is not None
+                    assert checkpoint_data["last_batch"] == 5
+                    assert checkpoint_data["processed_count"] == 150
+                    assert checkpoint_data["total_tickers"] == 3
+                    assert checkpoint_data["successful_saves"] == 750
+                    assert checkpoint_data["failed_tickers"] == ["FAIL1", "FAIL2"]
+                    assert "timestamp" in checkpoint_data
 
     def test_save_checkpoint_every_5_batches(self, sample_tickers):
         """Test that checkpoint is saved every 5 batches"""
@@ -624,11 +691,15 @@ class TestStockDataNotionRetrieverEdgeCases:
             return mock_open()(path, mode, **kwargs)
 
         with patch('builtins.open', side_effect=capture_open):
-            with patch('json.dump'):
-                retriever.save_checkpoint(1)
-
-                assert file_opened is not None
-                assert "retrieval_checkpoint.json" in file_opened
+            with patch('stock_notion_retrieval.os.replace') as mock_replace:
+                with patch('json.dump'):
+                    retriever.save_checkpoint(1)
+
+                    assert file_opened is not None
+                    assert "retrieval_checkpoint.json" in file_opened
+                    renamed_from, renamed_to = mock_replace.call_args[0]
+                    assert renamed_from == file_opened
+                    assert renamed_to.endswith("retrieval_checkpoint.json")
 
     def test_progress_logging_frequency(self, large_ticker_list):
         """Test that progress is logged every 10 tickers"""